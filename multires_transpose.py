@@ -1,12 +1,10 @@
 import bpy
-import bmesh
 import time
 import logging
-from .data_types import MeshDomain, MeshLayerType
-from .utils.bmesh_context import bmesh_from_obj
-from .utils.utils import copy_multires_objs_to_new_mesh, create_meshes_by_original_name, restore_vertex_index
-from .utils.utils import ORIGINAL_SUBDIVISION_LEVEL_LAYER
-from .utils.bmesh_utils import bmesh_copy_vert_location, read_layer_data
+from .utils.utils import copy_multires_objs_to_new_mesh, create_meshes_by_original_name, find_multires_modifier
+from .utils.utils import ORIGINAL_OBJECT_NAME_PROP, ORIGINAL_SUBDIVISION_LEVEL_PROP
+from .utils.mesh_utils import read_vertex_coordinates, write_vertex_coordinates, transform_meshes
+from .utils.numeric import linf_diff
 import numpy as np
 
 TRANSPOSE_TARGET_NAME = "Multires_Transpose_Target"
@@ -45,7 +43,8 @@ class MULTIRES_TRANSPOSE_OT_create_transpose_target(LoggerOperator):
     )
 
     def execute(self, context):
-        start_time = time.time()
+        # Only time the operator when the timing is going to be logged
+        start_time = time.perf_counter() if self.logger.isEnabledFor(logging.DEBUG) else None
         multires_level = self.multires_level if not self.use_multires_level_as_is else None
         transpose_target, merged_objs = copy_multires_objs_to_new_mesh(context, context.selected_objects, multires_level, self.include_non_multires)
         transpose_target.name = TRANSPOSE_TARGET_NAME
@@ -60,7 +59,8 @@ class MULTIRES_TRANSPOSE_OT_create_transpose_target(LoggerOperator):
         context.view_layer.objects.active = transpose_target
         transpose_target.select_set(True)
 
-        self.logger.debug(f"Time taken to create Transpose Target: {time.time() - start_time}")
+        if start_time is not None:
+            self.logger.debug(f"Time taken to create Transpose Target: {time.perf_counter() - start_time}")
         return {"FINISHED"}
 
     def draw(self, context):
@@ -117,7 +117,8 @@ class MULTIRES_TRANSPOSE_OT_apply_transpose_target(LoggerOperator):
     )
 
     def execute(self, context):
-        start_time = time.time()
+        # Only time the operator when the timing is going to be logged
+        start_time = time.perf_counter() if self.logger.isEnabledFor(logging.DEBUG) else None
 
         active_obj = context.active_object
 
@@ -125,10 +126,12 @@ class MULTIRES_TRANSPOSE_OT_apply_transpose_target(LoggerOperator):
         transpose_targets = create_meshes_by_original_name(active_obj)
         self.logger.debug(f"Created {len(transpose_targets)} transpose targets")
 
+        # Resolve the original object of every transpose target first and unhide them all at once, so that the
+        # visibility changes are picked up by a single depsgraph update instead of one between every reshape
+        resolved_targets = []
         for object in transpose_targets:
-            # Parse the original object name from the transpose target name
-            original_obj_name = ""
-            original_obj_name = object.name[:-len("_Target")]
+            # Read the original object name recorded on the transpose target
+            original_obj_name = object.get(ORIGINAL_OBJECT_NAME_PROP, "")
             if original_obj_name not in bpy.data.objects:
                 self.logger.warn(f"Object {object.name} does not have original object name recorded, skipping")
                 continue
@@ -136,59 +139,81 @@ class MULTIRES_TRANSPOSE_OT_apply_transpose_target(LoggerOperator):
             original_obj = bpy.data.objects[original_obj_name]
             # Make sure that it shows in the depsgraph
             original_obj.hide_set(False)
-
-            with bmesh_from_obj(object, write_back=False) as bm:
-                # A mesh after being split is not guaranteed to have the same vertex indices as the original mesh
-                restore_vertex_index(bm)
-                # Apply the inverse transformation of the original object because the original transformation
-                # was applied when the transpose target was created
-                bmesh.ops.transform(bm, verts=bm.verts, matrix=original_obj.matrix_world.inverted())
-                # Read the original multires level used to create this transpose target
-                original_multires_level = read_layer_data(bm, MeshDomain.VERTS, MeshLayerType.INT, ORIGINAL_SUBDIVISION_LEVEL_LAYER, uniform=True)
-
-                # Use the reshape operator to apply the transpose target if the original multires level is greater than 0
-                if original_multires_level > 0:
-                    diff = self.threshold + 1
-                    last_diff = iteration = 0
-
-                    # Apply edits to the bmesh object for use with the reshape operator
-                    bm.to_mesh(object.data)
-
-                    with bpy.context.temp_override(object=original_obj, selected_editable_objects=(original_obj, object)):
-                        multires_modifier = original_obj.modifiers[0]
-                        current_level = multires_modifier.levels
-
-                        # Set the multires level to the original multires level used to create the transpose target
-                        multires_modifier.levels = original_multires_level
-                        if not self.auto_iterations:
-                            for _ in range(self.iterations):
-                                bpy.ops.object.multires_reshape(modifier=multires_modifier.name)
-                        else:
-                            while diff > self.threshold and (abs(diff - last_diff) > 0.00001) and iteration < self.max_auto_iterations:
-                                bpy.ops.object.multires_reshape(modifier=multires_modifier.name)
-
-                                # Calculate difference between the original mesh and the transpose target mesh
-                                multires_mesh = context.evaluated_depsgraph_get().objects[original_obj.name].data
-                                verts = np.array([v.co for v in multires_mesh.vertices])
-                                new_verts = np.array([v.co for v in bm.verts])
-                                last_diff = diff
-                                diff = np.abs(verts - new_verts).max()
-
-                                iteration += 1
-
-                            self.logger.debug(
-                                f"\n*************Auto Rehape Iteration for Object {original_obj.name} Ended With:*************\n"
-                                f"{'Threshold:':<15}{self.threshold}\n"
-                                f"{'Diff:':<15}{diff}\n"
-                                f"{'Last Diff:':<15}{last_diff}\n"
-                                f"{'Iteration:':<15}{iteration}/{self.max_auto_iterations}"
-                            )
-                        multires_modifier.levels = current_level
-                # Directly copy vertex coordinates if the original multires level is 0 or if the original object
-                # has no multires modifier, in which case the original_multires_level will be -1
-                else:
-                    with bmesh_from_obj(original_obj) as obm:
-                        bmesh_copy_vert_location(bm, obm)
+            # Read the original multires level used to create this transpose target along with its name
+            resolved_targets.append((object, original_obj, object[ORIGINAL_SUBDIVISION_LEVEL_PROP]))
+
+        # Apply the inverse transformation of each original object because the original transformation
+        # was applied when the transpose target was created. All matrices are inverted in one call and
+        # passed on as arrays, so no intermediate Matrix objects are created
+        world_matrices = np.array([original_obj.matrix_world for _, original_obj, _ in resolved_targets], dtype=np.float64).reshape(-1, 4, 4)
+        inverse_matrices = np.linalg.inv(world_matrices).astype(np.float32)
+        target_cos = transform_meshes([object.data for object, _, _ in resolved_targets], inverse_matrices)
+
+        # Read the operator settings once instead of going through RNA on every reshape iteration
+        threshold, max_auto_iterations, iterations = self.threshold, self.max_auto_iterations, self.iterations
+
+        # The depsgraph is fetched once, each reshape only needs it to be re-evaluated before reading the multires mesh
+        depsgraph = context.evaluated_depsgraph_get()
+        for (object, original_obj, original_multires_level), target_co in zip(resolved_targets, target_cos):
+            # Use the reshape operator to apply the transpose target if the original multires level is greater than 0
+            if original_multires_level > 0:
+                diff = threshold + 1
+                last_diff = iteration = 0
+
+                with bpy.context.temp_override(object=original_obj, selected_editable_objects=(original_obj, object)):
+                    multires_modifier = find_multires_modifier(original_obj)
+                    current_level = multires_modifier.levels
+
+                    # Set the multires level to the original multires level used to create the transpose target
+                    multires_modifier.levels = original_multires_level
+                    if not self.auto_iterations:
+                        multires_co = previous_co = None
+                        for iteration in range(iterations):
+                            bpy.ops.object.multires_reshape(modifier=multires_modifier.name)
+
+                            # Stop early once another reshape no longer changes the multires mesh
+                            if iterations > 1:
+                                depsgraph.update()
+                                multires_mesh = original_obj.evaluated_get(depsgraph).data
+                                # Allocate both coordinate buffers on the first iteration and swap them afterwards,
+                                # keeping the previous coordinates without allocating every iteration
+                                if multires_co is None:
+                                    multires_co = np.empty(len(multires_mesh.vertices) * 3, dtype=np.float32)
+                                    previous_co = np.empty_like(multires_co)
+                                else:
+                                    multires_co, previous_co = previous_co, multires_co
+                                read_vertex_coordinates(multires_mesh, out=multires_co)
+                                if iteration > 0 and linf_diff(multires_co, previous_co) < 0.00001:
+                                    break
+                    else:
+                        # The transpose target doesn't change between iterations, only the multires mesh needs to be read again
+                        new_verts = target_co
+                        verts = np.empty_like(new_verts)
+                        # Buffer for the difference, reused so that no temporaries are allocated every iteration
+                        diff_buffer = np.empty_like(new_verts)
+                        while diff > threshold and (abs(diff - last_diff) > 0.00001) and iteration < max_auto_iterations:
+                            bpy.ops.object.multires_reshape(modifier=multires_modifier.name)
+
+                            # Calculate difference between the original mesh and the transpose target mesh
+                            depsgraph.update()
+                            multires_mesh = original_obj.evaluated_get(depsgraph).data
+                            read_vertex_coordinates(multires_mesh, out=verts)
+                            last_diff = diff
+                            diff = linf_diff(verts, new_verts, out=diff_buffer)
+                            iteration += 1
+
+                        self.logger.debug(
+                            f"\n*************Auto Rehape Iteration for Object {original_obj.name} Ended With:*************\n"
+                            f"{'Threshold:':<15}{threshold}\n"
+                            f"{'Diff:':<15}{diff}\n"
+                            f"{'Last Diff:':<15}{last_diff}\n"
+                            f"{'Iteration:':<15}{iteration}/{max_auto_iterations}"
+                        )
+                    multires_modifier.levels = current_level
+            # Directly copy vertex coordinates if the original multires level is 0 or if the original object
+            # has no multires modifier, in which case the original_multires_level will be -1
+            else:
+                write_vertex_coordinates(original_obj.data, target_co)
         # Cleanup targets
         for obj in transpose_targets:
             bpy.data.objects.remove(obj, do_unlink=True, do_id_user=True, do_ui_user=True)
@@ -196,7 +221,8 @@ class MULTIRES_TRANSPOSE_OT_apply_transpose_target(LoggerOperator):
         if self.hide_transpose:
             active_obj.hide_set(True)
 
-        self.logger.debug(f"Time taken to apply Transpose Target: {time.time() - start_time}")
+        if start_time is not None:
+            self.logger.debug(f"Time taken to apply Transpose Target: {time.perf_counter() - start_time}")
         return {'FINISHED'}
 
     def draw(self, context):
@@ -0,0 +1,450 @@
+import bpy
+import numpy as np
+from mathutils import Matrix
+from .numeric import dedup_and_remap, is_identity_matrix, transform_coordinates, transform_coordinates_batch
+from ..data_types import MeshDomain, MeshLayerType
+from typing import Iterable, List, Tuple, Any
+
+ATTRIBUTE_DOMAINS = {
+    MeshDomain.FACES: 'FACE',
+    MeshDomain.LOOPS: 'CORNER',
+    MeshDomain.EDGES: 'EDGE',
+    MeshDomain.VERTS: 'POINT',
+}
+# Attribute data type, foreach property name, numpy dtype and number of values per element of each layer type
+ATTRIBUTE_TYPES = {
+    MeshLayerType.STRING: ('STRING', 'value', None, 1),
+    MeshLayerType.INT: ('INT', 'value', np.int32, 1),
+    MeshLayerType.FLOAT: ('FLOAT', 'value', np.float32, 1),
+    MeshLayerType.FLOAT_VECTOR: ('FLOAT_VECTOR', 'vector', np.float32, 3),
+}
+# Foreach property name, numpy dtype and number of values per element of each Blender attribute data type copied by
+# mesh_join. Byte colors are read and written as floats, attributes of other data types are not copied
+JOIN_ATTRIBUTE_TYPES = {
+    'STRING': ('value', None, 1),
+    'BOOLEAN': ('value', bool, 1),
+    'INT8': ('value', np.int32, 1),
+    'INT': ('value', np.int32, 1),
+    'INT32_2D': ('value', np.int32, 2),
+    'FLOAT': ('value', np.float32, 1),
+    'FLOAT2': ('vector', np.float32, 2),
+    'FLOAT_VECTOR': ('vector', np.float32, 3),
+    'FLOAT_COLOR': ('color', np.float32, 4),
+    'BYTE_COLOR': ('color', np.float32, 4),
+    'QUATERNION': ('value', np.float32, 4),
+    'FLOAT4X4': ('value', np.float32, 16),
+}
+# Column of each attribute domain in the element counts returned by mesh_element_counts
+JOIN_ATTRIBUTE_DOMAINS = {'POINT': 0, 'EDGE': 1, 'CORNER': 2, 'FACE': 3}
+# Built-in element properties copied by mesh_join, as element collection, property name and numpy dtype
+JOIN_ELEMENT_PROPERTIES = [
+    ('vertices', 'hide', bool), ('vertices', 'select', bool),
+    ('edges', 'hide', bool), ('edges', 'select', bool), ('edges', 'use_seam', bool), ('edges', 'use_edge_sharp', bool),
+    ('polygons', 'hide', bool), ('polygons', 'select', bool), ('polygons', 'material_index', np.int32),
+]
+if bpy.app.version < (4, 0, 0):
+    # Edge creases and bevel weights are generic attributes since Blender 4.0
+    JOIN_ELEMENT_PROPERTIES += [('edges', 'crease', np.float32), ('edges', 'bevel_weight', np.float32)]
+# Column of each element collection in the element counts returned by mesh_element_counts
+JOIN_ELEMENT_COLLECTIONS = {'vertices': 0, 'edges': 1, 'polygons': 3}
+# Attributes not copied as generic attributes by mesh_join, either the topology and face smoothing it writes itself,
+# or the storage of the element properties above in newer Blender versions
+JOIN_SKIPPED_ATTRIBUTES = {
+    'position', '.edge_verts', '.corner_vert', '.corner_edge', 'sharp_face',
+    '.hide_vert', '.hide_edge', '.hide_poly', '.select_vert', '.select_edge', '.select_poly',
+    '.uv_seam', 'sharp_edge', 'material_index',
+}
+# Prefixes of the pin and selection attributes stored along with UV maps, which are copied through uv_layers instead
+JOIN_SKIPPED_ATTRIBUTE_PREFIXES = ('.vs.', '.es.', '.pn.')
+
+
+def decode_strings(values: Iterable[bytes]) -> List[str]:
+    """
+    Decode utf-8 bytes to strings, each distinct value is decoded once and its string is shared
+
+    Args:
+        values (Iterable[bytes]): bytes to decode
+
+    Returns:
+        List[str]: decoded strings
+    """
+    cache = {}
+    return [cache[value] if value in cache else cache.setdefault(value, value.decode("utf-8")) for value in values]
+
+
+def resolve_attribute(mesh: bpy.types.Mesh, domain: MeshDomain, layer_type: MeshLayerType, layer_name: str) -> bpy.types.Attribute:
+    """
+    Resolve the domain and layer type to the corresponding mesh attribute, create the attribute if it doesn't exist
+
+    Args:
+        mesh (bpy.types.Mesh): mesh to resolve the attribute on
+        domain (MeshDomain): domain where the data is stored
+        layer_type (MeshLayerType): type of the data
+        layer_name (str): name of the attribute
+
+    Returns:
+        bpy.types.Attribute: resolved attribute
+    """
+    attribute = mesh.attributes.get(layer_name, None)
+    if not attribute:
+        attribute = mesh.attributes.new(layer_name, ATTRIBUTE_TYPES[layer_type][0], ATTRIBUTE_DOMAINS[domain])
+    return attribute
+
+
+def write_attribute_data(mesh: bpy.types.Mesh, domain: MeshDomain, layer_type: MeshLayerType, layer_name: str, data: Iterable[Any]) -> None:
+    """
+    Write numeric custom data to a mesh's attribute in bulk with foreach_set, create the attribute if it doesn't exist.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh to write to
+        domain (MeshDomain): Domain to write to
+        layer_type (MeshLayerType): Layer type to write to
+        layer_name (str): Name of the attribute to write to
+        data (Iterable[Any]): Data to write, must cover the whole domain
+    """
+    attribute = resolve_attribute(mesh, domain, layer_type, layer_name)
+    _, prop, dtype, _ = ATTRIBUTE_TYPES[layer_type]
+    attribute.data.foreach_set(prop, np.ascontiguousarray(data, dtype=dtype).ravel())
+
+
+def read_attribute_data(mesh: bpy.types.Mesh, domain: MeshDomain, layer_type: MeshLayerType, layer_name: str) -> np.ndarray | List[str] | None:
+    """
+    Read custom data from a mesh's attribute. Numeric data is read in bulk with foreach_get, string data is read per element.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh to read from
+        domain (MeshDomain): Domain to read from
+        layer_type (MeshLayerType): Layer type to read from
+        layer_name (str): Name of the attribute to read from
+
+    Returns:
+        np.ndarray | List[str] | None: Data read, or None if the mesh has no such attribute
+    """
+    attribute = mesh.attributes.get(layer_name, None)
+    if not attribute or attribute.domain != ATTRIBUTE_DOMAINS[domain]:
+        return None
+    _, prop, dtype, stride = ATTRIBUTE_TYPES[layer_type]
+
+    if dtype is None:
+        return decode_strings(elem.value for elem in attribute.data)
+
+    data = np.empty(len(attribute.data) * stride, dtype=dtype)
+    attribute.data.foreach_get(prop, data)
+    return data
+
+
+def read_vertex_coordinates(mesh: bpy.types.Mesh, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Read the vertex coordinates of the given mesh in bulk
+
+    Args:
+        mesh (bpy.types.Mesh): mesh to read from
+        out (np.ndarray | None, optional): flat float32 buffer to read into, must fit all coordinates. Defaults to None.
+
+    Returns:
+        np.ndarray: flat float32 array of vertex coordinates
+    """
+    co = out if out is not None else np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co
+
+
+def write_vertex_coordinates(mesh: bpy.types.Mesh, co: np.ndarray) -> None:
+    """
+    Write the vertex coordinates of the given mesh in bulk
+
+    Args:
+        mesh (bpy.types.Mesh): mesh to write to
+        co (np.ndarray): flat float32 array of vertex coordinates, must have the same number of vertices as the mesh
+    """
+    if len(co) != len(mesh.vertices) * 3:
+        raise ValueError("co must have the same number of vertices as the mesh")
+
+    # foreach_set only copies in bulk when the buffer matches Blender's float32 storage
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(co, dtype=np.float32))
+    mesh.update()
+
+
+def write_attribute_ranges(mesh: bpy.types.Mesh, domain: MeshDomain, layer_type: MeshLayerType, layer_name: str, values: Iterable[Any], counts: Iterable[int]) -> None:
+    """
+    Write each numeric value to a contiguous range of a mesh's attribute, create the attribute if it doesn't exist.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh to write to
+        domain (MeshDomain): Domain to write to
+        layer_type (MeshLayerType): Layer type to write to
+        layer_name (str): Name of the attribute to write to
+        values (Iterable[Any]): Value of each range
+        counts (Iterable[int]): Number of elements in each range, ranges follow each other from the first element
+    """
+    attribute = resolve_attribute(mesh, domain, layer_type, layer_name)
+    _, prop, dtype, _ = ATTRIBUTE_TYPES[layer_type]
+    attribute.data.foreach_set(prop, np.repeat(np.asarray(values, dtype=dtype), counts, axis=0).ravel())
+
+
+def transform_meshes(meshes: List[bpy.types.Mesh], matrices: Iterable[Matrix | np.ndarray]) -> List[np.ndarray]:
+    """
+    Transform the vertices of each of the given meshes by its 4x4 matrix.
+    Coordinates are read and written serially, the transformations themselves run in parallel.
+
+    Args:
+        meshes (List[bpy.types.Mesh]): meshes to transform
+        matrices (Iterable[Matrix | np.ndarray]): transformation matrix of each mesh
+
+    Returns:
+        List[np.ndarray]: flat float32 array of the transformed vertex coordinates of each mesh
+    """
+    cos = transform_coordinates_batch([read_vertex_coordinates(mesh).reshape(-1, 3) for mesh in meshes], matrices)
+    cos = [co.ravel() for co in cos]
+    for mesh, co in zip(meshes, cos):
+        write_vertex_coordinates(mesh, co)
+    return cos
+
+
+def mesh_element_counts(meshes: Iterable[bpy.types.Mesh]) -> np.ndarray:
+    """
+    Count the elements of each of the given meshes
+
+    Args:
+        meshes (Iterable[bpy.types.Mesh]): meshes to count
+
+    Returns:
+        np.ndarray: (N, 4) array of the number of vertices, edges, loops and faces of each mesh
+    """
+    return np.array([(len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons)) for mesh in meshes], dtype=np.int64).reshape(-1, 4)
+
+
+def mesh_join(dst_mesh: bpy.types.Mesh, meshes: List[bpy.types.Mesh], matrices: List[Matrix], counts: np.ndarray | None = None) -> None:
+    """
+    Join the geometry of the given meshes into dst_mesh, transforming each mesh's vertices by its matrix.
+    dst_mesh is expected to be empty. Vertex positions, topology and face smoothing are copied here, UV maps,
+    element flags and generic attributes by mesh_join_attributes. Vertex groups belong to the objects and are
+    copied by join_vertex_groups. All elements are added to dst_mesh at once, sized from the element counts of the meshes.
+
+    Args:
+        dst_mesh (bpy.types.Mesh): empty mesh to join into
+        meshes (List[bpy.types.Mesh]): meshes to join
+        matrices (List[Matrix]): world matrix of each mesh
+        counts (np.ndarray | None, optional): element counts of the meshes as returned by mesh_element_counts.
+            Defaults to None, in which case they are counted here.
+    """
+    # Element counts of every mesh, and where each mesh's elements start in the joined mesh
+    if counts is None:
+        counts = mesh_element_counts(meshes)
+    starts = np.cumsum(counts, axis=0) - counts
+    num_verts, num_edges, num_loops, num_faces = counts.sum(axis=0)
+
+    # Flat buffers of the joined mesh, each mesh's data is read directly into its own slice
+    co = np.empty(num_verts * 3, dtype=np.float32)
+    edge_verts = np.empty(num_edges * 2, dtype=np.int32)
+    loop_verts = np.empty(num_loops, dtype=np.int32)
+    loop_edges = np.empty(num_loops, dtype=np.int32)
+    loop_starts = np.empty(num_faces, dtype=np.int32)
+    loop_totals = np.empty(num_faces, dtype=np.int32)
+    smooth = np.empty(num_faces, dtype=bool)
+
+    for mesh, matrix, (vert_start, edge_start, loop_start, face_start), (vert_count, edge_count, loop_count, face_count) in zip(meshes, matrices, starts, counts):
+        mesh_co = co[vert_start * 3:(vert_start + vert_count) * 3]
+        mesh.vertices.foreach_get("co", mesh_co)
+        # Objects without a transformation are copied as they are
+        if not is_identity_matrix(matrix):
+            mesh_co = mesh_co.reshape(-1, 3)
+            mesh_co[:] = transform_coordinates(mesh_co, matrix)
+
+        mesh_edge_verts = edge_verts[edge_start * 2:(edge_start + edge_count) * 2]
+        mesh.edges.foreach_get("vertices", mesh_edge_verts)
+        mesh_edge_verts += vert_start
+
+        mesh_loop_verts = loop_verts[loop_start:loop_start + loop_count]
+        mesh.loops.foreach_get("vertex_index", mesh_loop_verts)
+        mesh_loop_verts += vert_start
+        mesh_loop_edges = loop_edges[loop_start:loop_start + loop_count]
+        mesh.loops.foreach_get("edge_index", mesh_loop_edges)
+        mesh_loop_edges += edge_start
+
+        mesh_loop_starts = loop_starts[face_start:face_start + face_count]
+        mesh.polygons.foreach_get("loop_start", mesh_loop_starts)
+        mesh_loop_starts += loop_start
+        mesh.polygons.foreach_get("loop_total", loop_totals[face_start:face_start + face_count])
+        mesh.polygons.foreach_get("use_smooth", smooth[face_start:face_start + face_count])
+
+    dst_mesh.vertices.add(num_verts)
+    dst_mesh.edges.add(num_edges)
+    dst_mesh.loops.add(num_loops)
+    dst_mesh.polygons.add(num_faces)
+
+    dst_mesh.vertices.foreach_set("co", co)
+    dst_mesh.edges.foreach_set("vertices", edge_verts)
+    dst_mesh.loops.foreach_set("vertex_index", loop_verts)
+    dst_mesh.loops.foreach_set("edge_index", loop_edges)
+    dst_mesh.polygons.foreach_set("loop_start", loop_starts)
+    # Face sizes are derived from loop_start since Blender 4.0, where loop_total is read-only
+    if bpy.app.version < (4, 0, 0):
+        dst_mesh.polygons.foreach_set("loop_total", loop_totals)
+    dst_mesh.polygons.foreach_set("use_smooth", smooth)
+
+    mesh_join_attributes(dst_mesh, meshes, counts)
+    dst_mesh.update()
+
+
+def mesh_join_attributes(dst_mesh: bpy.types.Mesh, meshes: List[bpy.types.Mesh], counts: np.ndarray) -> None:
+    """
+    Copy the UV maps, element flags, material indices and generic attributes of the given meshes into dst_mesh,
+    whose elements are those of the meshes one after another as laid out by mesh_join. Each mesh's data is read
+    directly into its own slice of one buffer per layer. Meshes without a layer get zeros for it.
+
+    Args:
+        dst_mesh (bpy.types.Mesh): joined mesh to copy into
+        meshes (List[bpy.types.Mesh]): meshes that were joined
+        counts (np.ndarray): element counts of the meshes as returned by mesh_element_counts
+    """
+    starts = np.cumsum(counts, axis=0) - counts
+    totals = counts.sum(axis=0)
+
+    # Built-in element properties, only written if any mesh has a value other than the default
+    for collection, prop, dtype in JOIN_ELEMENT_PROPERTIES:
+        column = JOIN_ELEMENT_COLLECTIONS[collection]
+        data = np.empty(totals[column], dtype=dtype)
+        for mesh, start, count in zip(meshes, starts[:, column], counts[:, column]):
+            getattr(mesh, collection).foreach_get(prop, data[start:start + count])
+        if data.any():
+            getattr(dst_mesh, collection).foreach_set(prop, data)
+
+    # UV maps are matched by name
+    uv_names = list(dict.fromkeys(layer.name for mesh in meshes for layer in mesh.uv_layers))
+    for uv_name in uv_names:
+        uv = np.zeros(totals[2] * 2, dtype=np.float32)
+        for mesh, start, count in zip(meshes, starts[:, 2], counts[:, 2]):
+            layer = mesh.uv_layers.get(uv_name, None)
+            if layer is not None:
+                layer.data.foreach_get("uv", uv[start * 2:(start + count) * 2])
+        dst_mesh.uv_layers.new(name=uv_name, do_init=False).data.foreach_set("uv", uv)
+
+    # Generic attributes are matched by name, taking the data type and domain of the first mesh that has them
+    attributes = {}
+    for mesh in meshes:
+        for attribute in mesh.attributes:
+            name = attribute.name
+            if (name not in attributes and name not in JOIN_SKIPPED_ATTRIBUTES and name not in uv_names
+                    and not name.startswith(JOIN_SKIPPED_ATTRIBUTE_PREFIXES)
+                    and attribute.data_type in JOIN_ATTRIBUTE_TYPES and attribute.domain in JOIN_ATTRIBUTE_DOMAINS):
+                attributes[name] = (attribute.data_type, attribute.domain)
+
+    for name, (data_type, domain) in attributes.items():
+        prop, dtype, stride = JOIN_ATTRIBUTE_TYPES[data_type]
+        column = JOIN_ATTRIBUTE_DOMAINS[domain]
+        dst_attribute = dst_mesh.attributes.new(name, data_type, domain)
+        sources = [mesh.attributes.get(name, None) for mesh in meshes]
+        sources = [source if source is not None and source.data_type == data_type and source.domain == domain else None for source in sources]
+
+        if dtype is None:
+            values = [b""] * totals[column]
+            for source, start, count in zip(sources, starts[:, column], counts[:, column]):
+                if source is not None:
+                    values[start:start + count] = [elem.value for elem in source.data]
+            for value, elem in zip(values, dst_attribute.data):
+                elem.value = value
+            continue
+
+        data = np.zeros(totals[column] * stride, dtype=dtype)
+        for source, start, count in zip(sources, starts[:, column], counts[:, column]):
+            if source is not None:
+                source.data.foreach_get(prop, data[start * stride:(start + count) * stride])
+        dst_attribute.data.foreach_set(prop, data)
+
+
+def join_vertex_groups(dst_obj: bpy.types.Object, objects: List[bpy.types.Object], meshes: List[bpy.types.Mesh], counts: np.ndarray) -> None:
+    """
+    Copy the vertex group weights of the given objects onto dst_obj, whose mesh was joined from their meshes by
+    mesh_join. Groups are matched by name and created on dst_obj if needed. There is no bulk access to vertex
+    weights, so this loops in Python over every vertex of each object's mesh, which is the subdivided multires mesh,
+    and painted groups take up to one VertexGroup.add call per vertex. Objects without vertex groups are skipped.
+
+    Args:
+        dst_obj (bpy.types.Object): object of the joined mesh
+        objects (List[bpy.types.Object]): objects whose vertex groups are copied
+        meshes (List[bpy.types.Mesh]): mesh of each object that was joined
+        counts (np.ndarray): element counts of the meshes as returned by mesh_element_counts
+    """
+    vert_starts = np.cumsum(counts[:, 0]) - counts[:, 0]
+    for obj, mesh, vert_start in zip(objects, meshes, vert_starts.tolist()):
+        if not obj.vertex_groups:
+            continue
+        dst_groups = [dst_obj.vertex_groups.get(group.name, None) or dst_obj.vertex_groups.new(name=group.name) for group in obj.vertex_groups]
+
+        # Vertices sharing a group and an exact weight are added in one call. This only saves calls for groups with
+        # few distinct weights, such as fully assigned ones, painted weights are mostly distinct
+        group_weights = {}
+        for vert in mesh.vertices:
+            for elem in vert.groups:
+                group_weights.setdefault((elem.group, elem.weight), []).append(vert.index + vert_start)
+        for (group, weight), indices in group_weights.items():
+            dst_groups[group].add(indices, weight, 'REPLACE')
+
+
+def mesh_split(src_mesh: bpy.types.Mesh, face_groups: Iterable[np.ndarray], dst_meshes: Iterable[bpy.types.Mesh], point_layers: Iterable[Tuple[MeshLayerType, str]] = (), vertex_order_layer: str | None = None) -> None:
+    """
+    Copy each group of faces of src_mesh into its own empty destination mesh. Vertices keep their relative order,
+    or are placed at the index recorded in vertex_order_layer if given. Only vertex positions, topology,
+    face smoothing and the given vertex layers are copied.
+
+    Args:
+        src_mesh (bpy.types.Mesh): mesh to copy faces from
+        face_groups (Iterable[np.ndarray]): face indices of each group
+        dst_meshes (Iterable[bpy.types.Mesh]): empty mesh to copy each group into
+        point_layers (Iterable[Tuple[MeshLayerType, str]], optional): vertex layers to copy. Defaults to ().
+        vertex_order_layer (str | None, optional): int vertex layer holding the index of each vertex within its group.
+            Defaults to None.
+    """
+    co = np.empty(len(src_mesh.vertices) * 3, dtype=np.float32)
+    src_mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3)
+    loop_verts = np.empty(len(src_mesh.loops), dtype=np.int32)
+    src_mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_starts = np.empty(len(src_mesh.polygons), dtype=np.int32)
+    src_mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(len(src_mesh.polygons), dtype=np.int32)
+    src_mesh.polygons.foreach_get("loop_total", loop_totals)
+    smooth = np.empty(len(src_mesh.polygons), dtype=bool)
+    src_mesh.polygons.foreach_get("use_smooth", smooth)
+    layers = [(layer_type, layer_name, read_attribute_data(src_mesh, MeshDomain.VERTS, layer_type, layer_name)) for layer_type, layer_name in point_layers]
+    vertex_order = read_attribute_data(src_mesh, MeshDomain.VERTS, MeshLayerType.INT, vertex_order_layer) if vertex_order_layer else None
+
+    for faces, dst_mesh in zip(face_groups, dst_meshes):
+        # Gather the loops of the group's faces and where each face starts in the new mesh
+        group_loop_totals = loop_totals[faces]
+        group_loop_starts = np.cumsum(group_loop_totals, dtype=np.int32) - group_loop_totals
+        loops = np.repeat(loop_starts[faces] - group_loop_starts, group_loop_totals) + np.arange(group_loop_totals.sum(), dtype=np.int32)
+
+        # Vertices used by the group in ascending index order, and the new index of each loop's vertex
+        verts, group_loop_verts = dedup_and_remap(loop_verts[loops])
+        group_vertex_order = vertex_order[verts] if vertex_order is not None else None
+        # Place every vertex at its recorded index instead, so no reordering is needed afterwards. Groups whose
+        # vertices already are in their recorded order, as when the original mesh is copied as is, are left alone
+        if group_vertex_order is not None and not np.array_equal(group_vertex_order, np.arange(len(verts))):
+            # Every index must be recorded exactly once, which no longer holds once vertices were added or removed
+            if (group_vertex_order.min() < 0 or group_vertex_order.max() >= len(verts)
+                    or not np.all(np.bincount(group_vertex_order, minlength=len(verts)) == 1)):
+                raise ValueError("Vertex order recorded on the faces does not match their vertices, cannot split to transpose targets")
+            group_loop_verts = group_vertex_order[group_loop_verts]
+            ordered_verts = np.empty_like(verts)
+            ordered_verts[group_vertex_order] = verts
+            verts = ordered_verts
+
+        dst_mesh.vertices.add(len(verts))
+        dst_mesh.loops.add(len(loops))
+        dst_mesh.polygons.add(len(faces))
+
+        dst_mesh.vertices.foreach_set("co", co[verts].ravel())
+        dst_mesh.loops.foreach_set("vertex_index", group_loop_verts)
+        dst_mesh.polygons.foreach_set("loop_start", group_loop_starts)
+        # Face sizes are derived from loop_start since Blender 4.0, where loop_total is read-only
+        if bpy.app.version < (4, 0, 0):
+            dst_mesh.polygons.foreach_set("loop_total", group_loop_totals)
+        dst_mesh.polygons.foreach_set("use_smooth", smooth[faces])
+
+        for layer_type, layer_name, data in layers:
+            if data is not None:
+                write_attribute_data(dst_mesh, MeshDomain.VERTS, layer_type, layer_name, data.reshape(len(co), -1)[verts])
+
+        dst_mesh.update(calc_edges=True)
@@ -0,0 +1,152 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from mathutils import Matrix
+from typing import Iterable, List, Tuple
+
+# Numba is not bundled with Blender, use it to compile the numeric kernels if it has been installed
+try:
+    import numba
+except ImportError:
+    numba = None
+
+IDENTITY_MATRIX = np.identity(4, dtype=np.float32)
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _transform_coordinates_kernel(co_out, co_in, matrix):
+        for i in numba.prange(co_in.shape[0]):
+            x, y, z = co_in[i, 0], co_in[i, 1], co_in[i, 2]
+            for k in range(3):
+                co_out[i, k] = matrix[k, 0] * x + matrix[k, 1] * y + matrix[k, 2] * z + matrix[k, 3]
+
+    @numba.njit(cache=True)
+    def _dedup_and_remap_kernel(indices, min_index, max_index):
+        # Mark the used indices, then number them in ascending order
+        new_indices = np.full(max_index - min_index + 1, -1, dtype=np.int32)
+        for i in range(indices.size):
+            new_indices[indices[i] - min_index] = 0
+        unique = np.empty(indices.size, dtype=np.int32)
+        count = 0
+        for i in range(new_indices.size):
+            if new_indices[i] == 0:
+                new_indices[i] = count
+                unique[count] = i + min_index
+                count += 1
+        remap = np.empty(indices.size, dtype=np.int32)
+        for i in range(indices.size):
+            remap[i] = new_indices[indices[i] - min_index]
+        return unique[:count], remap
+
+    @numba.njit(fastmath=True, cache=True)
+    def _linf_diff_kernel(a, b):
+        max_diff = 0.0
+        for i in range(a.size):
+            diff = abs(a[i] - b[i])
+            if diff > max_diff:
+                max_diff = diff
+        return max_diff
+
+
+def is_identity_matrix(matrix: Matrix | np.ndarray) -> bool:
+    """
+    Check whether the given 4x4 matrix leaves coordinates unchanged
+
+    Args:
+        matrix (Matrix | np.ndarray): matrix to check
+
+    Returns:
+        bool: True if the matrix is exactly the identity matrix
+    """
+    return np.array_equal(np.asarray(matrix, dtype=np.float32), IDENTITY_MATRIX)
+
+
+def transform_coordinates(co: np.ndarray, matrix: Matrix | np.ndarray) -> np.ndarray:
+    """
+    Transform an (N, 3) array of vertex coordinates by the given 4x4 matrix. Uses a compiled kernel if numba is available.
+
+    Args:
+        co (np.ndarray): vertex coordinates to transform, converted to float32 if needed
+        matrix (Matrix | np.ndarray): transformation matrix
+
+    Returns:
+        np.ndarray: transformed (N, 3) float32 coordinates
+    """
+    # Keep coordinates in float32 like Blender stores them, arrays that already are float32 are not copied
+    co = np.ascontiguousarray(co, dtype=np.float32)
+    # Matrices already converted to float32 arrays are used as they are
+    matrix = np.asarray(matrix, dtype=np.float32)
+
+    if numba is not None:
+        co_out = np.empty_like(co)
+        _transform_coordinates_kernel(co_out, co, matrix)
+        return co_out
+
+    return co @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def transform_coordinates_batch(cos: List[np.ndarray], matrices: Iterable[Matrix | np.ndarray]) -> List[np.ndarray]:
+    """
+    Transform several (N, 3) arrays of vertex coordinates, each by its own 4x4 matrix.
+    The NumPy path releases the GIL, so independent arrays are transformed on a thread pool. The numba kernel
+    is already parallel and its threading layer is not safe to enter from several threads, so it runs serially.
+
+    Args:
+        cos (List[np.ndarray]): float32 vertex coordinates to transform
+        matrices (Iterable[Matrix | np.ndarray]): transformation matrix of each array
+
+    Returns:
+        List[np.ndarray]: transformed (N, 3) float32 coordinates
+    """
+    # Convert the matrices here, mathutils objects are only touched by the calling thread
+    matrices = [np.asarray(matrix, dtype=np.float32) for matrix in matrices]
+
+    if numba is not None or len(cos) < 2:
+        return [transform_coordinates(co, matrix) for co, matrix in zip(cos, matrices)]
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(transform_coordinates, cos, matrices))
+
+
+def linf_diff(a: np.ndarray, b: np.ndarray, out: np.ndarray | None = None) -> float:
+    """
+    Largest absolute difference between two flat arrays of the same size. Uses a compiled single pass kernel
+    if numba is available.
+
+    Args:
+        a (np.ndarray): first flat float32 array
+        b (np.ndarray): second flat float32 array
+        out (np.ndarray | None, optional): buffer the size of a for the difference, only used without numba so that
+            repeated calls don't allocate temporaries. Defaults to None.
+
+    Returns:
+        float: largest absolute difference
+    """
+    if numba is not None:
+        return float(_linf_diff_kernel(a, b))
+
+    diff = np.subtract(a, b, out=out)
+    return float(np.abs(diff, out=diff).max())
+
+
+def dedup_and_remap(indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the unique values of an index array and the position of each index among them. Uses a compiled kernel
+    if numba is available.
+
+    Args:
+        indices (np.ndarray): int32 indices, may contain duplicates
+
+    Returns:
+        np.ndarray, np.ndarray: int32 unique indices in ascending order, and for each of the given indices
+            its position in the unique indices
+    """
+    indices = np.ascontiguousarray(indices, dtype=np.int32)
+    if not indices.size:
+        return indices, indices
+
+    if numba is not None:
+        return _dedup_and_remap_kernel(indices, int(indices.min()), int(indices.max()))
+
+    unique, remap = np.unique(indices, return_inverse=True)
+    return unique, remap.astype(np.int32).ravel()
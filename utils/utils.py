@@ -1,17 +1,42 @@
 # Import all missing imports
 import bpy
-import bmesh
+import random
+import numpy as np
 from typing import Iterable, List, Tuple
-from .bmesh_context import bmesh_from_obj
-from .bmesh_utils import write_layer_data, read_layer_data, bmesh_join, bmesh_from_faces
+from .mesh_utils import read_attribute_data, write_attribute_data, write_attribute_ranges, mesh_element_counts, mesh_join, mesh_split, join_vertex_groups
 from ..data_types import MeshDomain, MeshLayerType
 
 ORIGINAL_OBJECT_NAME_LAYER = "original_object_name"
+ORIGINAL_OBJECT_ID_LAYER = "original_object_id"
 ORIGINAL_VERTEX_INDEX_LAYER = "original_vertex_index"
 ORIGINAL_SUBDIVISION_LEVEL_LAYER = "original_subdivision_level"
+# Face layer and mesh custom property holding a random id of the transpose target, the two only differ once faces of
+# another mesh were joined into the transpose target
+TRANSPOSE_TARGET_ID_LAYER = "transpose_target_id"
+TRANSPOSE_TARGET_ID_PROP = "transpose_target_id"
+# Mesh custom properties holding the original object names and subdivision levels. Ids in ORIGINAL_OBJECT_ID_LAYER
+# are offset by 1 from the index in these tables, as id 0 is left for faces that were not recorded
+ORIGINAL_OBJECT_NAMES_PROP = "original_object_names"
+ORIGINAL_SUBDIVISION_LEVELS_PROP = "original_subdivision_levels"
+# Object custom properties holding the original object name and subdivision level of a split transpose target
+ORIGINAL_OBJECT_NAME_PROP = "original_object_name"
+ORIGINAL_SUBDIVISION_LEVEL_PROP = "original_subdivision_level"
+
+
+def find_multires_modifier(obj: bpy.types.Object) -> bpy.types.MultiresModifier | None:
+    """
+    Find the first multiresolution modifier of the given object
 
+    Args:
+        obj (bpy.types.Object): Object to search
 
-def set_multires_to_nth_level(objects: Iterable[bpy.types.Object], n: int | None) -> Tuple[set[bpy.types.Object], List[int]]:
+    Returns:
+        bpy.types.MultiresModifier | None: The multires modifier, or None if the object has none
+    """
+    return next((mod for mod in obj.modifiers if mod.type == "MULTIRES"), None)
+
+
+def set_multires_to_nth_level(objects: Iterable[bpy.types.Object], n: int | None) -> Tuple[List[bpy.types.Object], List[int]]:
     """
     set all selected object's multiresolution modifier's view subdivision level to the first level
 
@@ -20,39 +45,26 @@ def set_multires_to_nth_level(objects: Iterable[bpy.types.Object], n: int | None
         n (int | None): Level to set multires to. If None will use multires levels as they are
 
     Returns:
-        set[bpy.types.Object], list[int]: Objects that have had they multires level changed, and their subdivision level
+        list[bpy.types.Object], list[int]: Objects that have had they multires level changed in the order they were
+            given, and their subdivision level
     """
     changed_objs = []
     levels = []
-    for obj in set(objects):
+    # Deduplicate while keeping the given order so that objects and levels line up the same way on every run
+    for obj in dict.fromkeys(objects):
         if obj.type == "MESH":
-            for mod in obj.modifiers:
-                if mod.type == "MULTIRES":
-                    if n is not None:
-                        mod.levels = n
-                    changed_objs.append(obj)
-                    levels.append(mod.levels)
-                    break
+            mod = find_multires_modifier(obj)
+            if mod is not None:
+                if n is not None:
+                    mod.levels = n
+                changed_objs.append(obj)
+                levels.append(mod.levels)
     return changed_objs, levels
 
 
-def restore_vertex_index(bm: bmesh.types.BMesh) -> None:
-    """
-    Restore the vertex indices of the given object to the original vertex indices
-
-    Args:
-        object (bpy.types.Object): Object to restore vertex indices on
-    """
-    original_vertex_indices = read_layer_data(bm, MeshDomain.VERTS, MeshLayerType.INT, ORIGINAL_VERTEX_INDEX_LAYER)
-    for v, original_index in zip(bm.verts, original_vertex_indices):
-        v.index = original_index
-    bm.verts.sort()
-    bm.verts.ensure_lookup_table()
-
-
 def create_meshes_by_original_name(object: bpy.types.Object) -> List[bpy.types.Object]:
     """
-    Split the given object into multiple objects based on the original object name recorded in the mesh's face layer.
+    Split the given object into multiple objects based on the original object recorded in the mesh's face layers.
     The given object's mesh is not modified.
 
     Args:
@@ -63,31 +75,72 @@ def create_meshes_by_original_name(object: bpy.types.Object) -> List[bpy.types.O
     """
     split_objects = []
     depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = object.evaluated_get(depsgraph)
 
-    with bmesh_from_obj(depsgraph.objects[object.name]) as bm:
-        original_obj_names = read_layer_data(bm, MeshDomain.FACES, MeshLayerType.STRING, ORIGINAL_OBJECT_NAME_LAYER, uniform=False)
-        if not all(original_obj_names):
+    original_obj_ids = read_attribute_data(eval_obj.data, MeshDomain.FACES, MeshLayerType.INT, ORIGINAL_OBJECT_ID_LAYER)
+    if original_obj_ids is None:
+        # Transpose targets created before object ids were recorded only have the object names
+        original_obj_names = read_attribute_data(eval_obj.data, MeshDomain.FACES, MeshLayerType.STRING, ORIGINAL_OBJECT_NAME_LAYER)
+        if not original_obj_names or not all(original_obj_names):
             raise ValueError("Object does not have original object names recorded on all faces, cannot split to transpose targets")
-        transpose_map = {name: [] for name in set(original_obj_names)}
-
-        # Create a map of original object names to faces
-        for face, name in zip(bm.faces, original_obj_names):
-            transpose_map[name].append(face)
-
-        for obj_name, faces in transpose_map.items():
-            face_index_min = min(faces, key=lambda f: f.index).index
-            face_index_max = max(faces, key=lambda f: f.index).index
-
-            # Create a new bmesh from the faces associated with the original object
-            d_bm = bmesh_from_faces(bm, bm.faces[face_index_min:face_index_max + 1])
-            temp_mesh = bpy.data.meshes.new(name=f"{obj_name}_tgt")
-            d_bm.to_mesh(temp_mesh)
-            d_bm.free()
-
-            # Create object from mesh and link it
-            tmp_obj = bpy.data.objects.new(name=f"{obj_name}_Target", object_data=temp_mesh)
-            bpy.context.collection.objects.link(tmp_obj)
-            split_objects.append(tmp_obj)
+        # Number the names in a single pass in order of first appearance instead of sorting all of them
+        name_ids = {}
+        original_obj_ids = np.fromiter((name_ids.setdefault(name, len(name_ids)) for name in original_obj_names), dtype=np.int32, count=len(original_obj_names))
+    else:
+        # Faces added after the transpose target was created, e.g. in edit mode, have the default id 0
+        if not original_obj_ids.size or original_obj_ids.min() < 1:
+            raise ValueError("Object does not have original object names recorded on all faces, cannot split to transpose targets")
+        original_obj_ids -= 1
+
+        # Joining another transpose target would map its ids onto the names of this one
+        target_id = object.data.get(TRANSPOSE_TARGET_ID_PROP, None)
+        target_ids = read_attribute_data(eval_obj.data, MeshDomain.FACES, MeshLayerType.INT, TRANSPOSE_TARGET_ID_LAYER)
+        if target_id is not None and (target_ids is None or np.any(target_ids != target_id)):
+            raise ValueError("Object has faces of several transpose targets joined together, cannot split to transpose targets")
+
+    # Group faces by original object, faces of each group are in ascending index order. The ids are small
+    # non-negative integers, so the group bounds are counted instead of scanning the sorted ids again
+    face_order = np.argsort(original_obj_ids, kind="stable")
+    group_sizes = np.bincount(original_obj_ids)
+    group_ids = np.flatnonzero(group_sizes)
+    group_ends = np.cumsum(group_sizes)[group_ids]
+    group_starts = group_ends - group_sizes[group_ids]
+    face_groups = [face_order[group_start:group_end] for group_start, group_end in zip(group_starts, group_ends)]
+
+    name_table = object.data.get(ORIGINAL_OBJECT_NAMES_PROP, None)
+    if name_table is not None:
+        name_table = list(name_table)
+        obj_names = [name_table[group_id] if group_id < len(name_table) else "" for group_id in group_ids]
+    else:
+        # Fall back to the name recorded on the first face of each group, new transpose targets only have the table
+        name_attribute = eval_obj.data.attributes.get(ORIGINAL_OBJECT_NAME_LAYER, None)
+        if name_attribute is None:
+            raise ValueError("Object does not have original object names recorded, cannot split to transpose targets")
+        obj_names = [name_attribute.data[int(faces[0])].value.decode("utf-8") for faces in face_groups]
+    if not all(obj_names):
+        raise ValueError("Object does not have original object names recorded on all faces, cannot split to transpose targets")
+
+    point_layers = []
+    level_table = object.data.get(ORIGINAL_SUBDIVISION_LEVELS_PROP, None)
+    if level_table is None:
+        # Transpose targets created before the level table existed record the level on every vertex
+        point_layers.append((MeshLayerType.INT, ORIGINAL_SUBDIVISION_LEVEL_LAYER))
+
+    # Create a new mesh from the faces associated with each original object
+    temp_meshes = [bpy.data.meshes.new(name=f"{obj_name}_tgt") for obj_name in obj_names]
+    # Vertices are written at their original indices, as the merged mesh doesn't keep each object's vertex order
+    mesh_split(eval_obj.data, face_groups, temp_meshes, point_layers, vertex_order_layer=ORIGINAL_VERTEX_INDEX_LAYER)
+
+    for group_id, obj_name, temp_mesh in zip(group_ids, obj_names, temp_meshes):
+        # Create object from mesh and link it
+        tmp_obj = bpy.data.objects.new(name=f"{obj_name}_Target", object_data=temp_mesh)
+        tmp_obj[ORIGINAL_OBJECT_NAME_PROP] = obj_name
+        if level_table is not None:
+            tmp_obj[ORIGINAL_SUBDIVISION_LEVEL_PROP] = level_table[int(group_id)]
+        else:
+            tmp_obj[ORIGINAL_SUBDIVISION_LEVEL_PROP] = temp_mesh.attributes[ORIGINAL_SUBDIVISION_LEVEL_LAYER].data[0].value
+        bpy.context.collection.objects.link(tmp_obj)
+        split_objects.append(tmp_obj)
 
     return split_objects
 
@@ -106,64 +159,73 @@ def copy_multires_objs_to_new_mesh(context: bpy.types.Context, objects: Iterable
         bpy.types.Object: merged object
         List[bpy.types.Object]: list of objects that were merged
     """
-    def record_data_helper(bm, object, multires_level):
-        # Apply transformations to the mesh
-        bmesh.ops.transform(bm, verts=bm.verts, matrix=object.matrix_world)
-
-        # Record the original object names in the new object's face layer
-        write_layer_data(bm, MeshDomain.FACES, MeshLayerType.STRING, ORIGINAL_OBJECT_NAME_LAYER, [object.name for f in bm.faces])
-
-        # Record the original vertex indices in the new object's vertex layer
-        write_layer_data(bm, MeshDomain.VERTS, MeshLayerType.INT, ORIGINAL_VERTEX_INDEX_LAYER, [v.index for v in bm.verts])
-
-        # Record the original subidivision level in the new object's vertex layer, or -1 if multires_level is None
-        write_layer_data(bm, MeshDomain.VERTS, MeshLayerType.INT, ORIGINAL_SUBDIVISION_LEVEL_LAYER, [(multires_level if multires_level is not None else -1) for _ in bm.verts])
-
     # Create new mesh and object, then link it
     transpose_target_mesh = bpy.data.meshes.new(name="Multires_Transpose_Target")
 
     multires_objs, multires_levels = set_multires_to_nth_level(objects, level)
 
     disabled_modifiers = []
-    # Disable modifiers besides the multires modifier
+    # Disable modifiers besides the multires modifier, skipping those already disabled so that
+    # only modifiers that affect the evaluation are toggled and re-enabled afterwards
     for obj in multires_objs:
         for mod in obj.modifiers:
-            if mod.type != "MULTIRES":
+            if mod.type != "MULTIRES" and mod.show_viewport:
                 mod.show_viewport = False
                 disabled_modifiers.append(mod)
 
     depsgraph = context.evaluated_depsgraph_get()
 
-    bms = []
-    merged_objs = []
-
-    for i, object in enumerate(multires_objs):
-        bm = bmesh.new()
-        bm.from_mesh(depsgraph.objects[object.name].data)
-        record_data_helper(bm, object, multires_levels[i])
-        bms.append(bm)
-        merged_objs.append(object)
+    merged_objs = list(multires_objs)
+    # The evaluated object's data already is the mesh with the multires modifier applied, reading it directly
+    # avoids looking objects up by name and the extra copy made by to_mesh()
+    meshes = [object.evaluated_get(depsgraph).data for object in multires_objs]
+    levels = list(multires_levels)
 
     if use_non_multires:
-        non_multires_objects = [obj for obj in objects if obj not in multires_objs]
+        non_multires_objects = [obj for obj in dict.fromkeys(objects) if obj not in multires_objs]
         for object in non_multires_objects:
-            bm = bmesh.new()
-            bm.from_mesh(object.data)
-            record_data_helper(bm, object, None)
-            bms.append(bm)
             merged_objs.append(object)
+            meshes.append(object.data)
+            # Record -1 as the subdivision level of objects without a multires modifier
+            levels.append(-1)
+
+    # Apply transformations and merge all meshes into the transpose target
+    # Count the elements of all meshes once, both to size the transpose target and to lay out the recorded layers
+    counts = mesh_element_counts(meshes)
+    mesh_join(transpose_target_mesh, meshes, [object.matrix_world for object in merged_objs], counts)
+
+    vert_counts, face_counts = counts[:, 0].astype(np.int32), counts[:, 3]
+    vert_starts = np.cumsum(vert_counts) - vert_counts
+
+    # Record the index of the original object in the new object's face layer, used to split the faces back by object,
+    # and the table of original object names the indices refer to. The names are only stored once in the table rather
+    # than on every face, ORIGINAL_OBJECT_NAME_LAYER is only read from transpose targets created before the table existed.
+    # Indices are recorded from 1 so that faces added later, which get the default 0, are not taken for the first object
+    write_attribute_ranges(transpose_target_mesh, MeshDomain.FACES, MeshLayerType.INT, ORIGINAL_OBJECT_ID_LAYER,
+                           range(1, len(merged_objs) + 1), face_counts)
+    transpose_target_mesh[ORIGINAL_OBJECT_NAMES_PROP] = [object.name for object in merged_objs]
+
+    # Record the random id of the transpose target on the mesh and on every face, to detect other meshes joined into it
+    target_id = random.randint(1, np.iinfo(np.int32).max)
+    write_attribute_ranges(transpose_target_mesh, MeshDomain.FACES, MeshLayerType.INT, TRANSPOSE_TARGET_ID_LAYER,
+                           (target_id,), (face_counts.sum(),))
+    transpose_target_mesh[TRANSPOSE_TARGET_ID_PROP] = target_id
+
+    # Record the original subidivision level of each object, or -1 for objects without a multires modifier
+    transpose_target_mesh[ORIGINAL_SUBDIVISION_LEVELS_PROP] = levels
+
+    # Record the original vertex indices in the new object's vertex layer, counting from 0 for each object
+    write_attribute_data(transpose_target_mesh, MeshDomain.VERTS, MeshLayerType.INT, ORIGINAL_VERTEX_INDEX_LAYER,
+                         np.arange(vert_counts.sum(), dtype=np.int32) - np.repeat(vert_starts, vert_counts))
 
-    final_bm = bmesh_join(bms)
-    final_bm.to_mesh(transpose_target_mesh)
-    final_bm.free()
-
-    for bm in bms:
-        bm.free()
+    transpose_target_obj = bpy.data.objects.new(name="Multires_Transpose_Target", object_data=transpose_target_mesh)
+    context.collection.objects.link(transpose_target_obj)
+    # Vertex groups are stored on the objects, so they can only be copied once the transpose target object exists.
+    # They are read from the evaluated meshes, so this is done before the modifiers are reenabled
+    join_vertex_groups(transpose_target_obj, merged_objs, meshes, counts)
 
     # Reenable disabled modifiers
     for mod in disabled_modifiers:
         mod.show_viewport = True
 
-    transpose_target_obj = bpy.data.objects.new(name="Multires_Transpose_Target", object_data=transpose_target_mesh)
-    context.collection.objects.link(transpose_target_obj)
     return transpose_target_obj, merged_objs